@@ -54,6 +54,28 @@ def main():
         help="How to authenticate with Bugzilla: 'query' (default) sends the API key as the api_key query parameter; 'bearer' sends it as an Authorization: Bearer <KEY> header (required for some Bugzilla instances such as Red Hat Bugzilla). Environment variable BUGZILLA_AUTH_MODE can also be used. Replaces --use-auth-header.",
     )
 
+    # --- Connection pool to Bugzilla ---
+    parser.add_argument(
+        "--bugzilla-max-connections",
+        type=int,
+        default=int(os.getenv("MCP_BZ_MAX_CONN", "100")),
+        help="Maximum number of concurrent connections to the Bugzilla server. Defaults to 100 or MCP_BZ_MAX_CONN environment variable.",
+    )
+    parser.add_argument(
+        "--bugzilla-max-keepalive",
+        type=int,
+        default=int(os.getenv("MCP_BZ_KEEPALIVE", "20")),
+        help="Maximum number of idle connections to the Bugzilla server kept open for reuse. Defaults to 20 or MCP_BZ_KEEPALIVE environment variable.",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default=os.getenv("LOG_LEVEL", "INFO").upper(),
+        help="Log level of the server. WARNING or above skips the per-request INFO lines. Defaults to INFO or LOG_LEVEL environment variable.",
+    )
+
     # --- Deprecated args kept for backward compatibility ---
     # TODO: Remove deprecated args when deprecation period expires.
     parser.add_argument(
@@ -114,6 +136,11 @@ def main():
         )
         sys.exit(1)
 
+    if args.bugzilla_max_connections < 1:
+        parser.error("--bugzilla-max-connections must be at least 1")
+    if args.bugzilla_max_keepalive < 0:
+        parser.error("--bugzilla-max-keepalive must not be negative")
+
     # TODO: Remove deprecated arg handling when deprecation period expires.
     # Map deprecated args to their replacements, with a visible warning.
     _new_auth_header_set = os.getenv("MCP_AUTH_HEADER") or any(
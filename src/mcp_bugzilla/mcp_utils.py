@@ -7,13 +7,23 @@ License: Apache 2.0
 """
 
 import asyncio
+import atexit
+import http.cookiejar
 import logging
 import os
+import queue
 import re
+import sys
 from datetime import datetime
-from typing import Any, Optional
+from itertools import filterfalse
+from logging.handlers import QueueHandler, QueueListener
+from operator import methodcaller
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Optional
 
 import httpx
+import ijson
+import orjson
 from httpx_retries import RetryTransport
 
 
@@ -30,34 +40,120 @@ class ColorFormatter(logging.Formatter):
 
     FORMAT = "[%(levelname)s]: %(message)s"
 
-    def format(self, record):
-        log_fmt = self.FORMAT
-        if isinstance(record.msg, str):
-            if "[LLM-REQ]" in record.msg:
-                log_fmt = self.CYAN + self.FORMAT + self.RESET
-            elif "[LLM-RES]" in record.msg:
-                log_fmt = self.CYAN + self.FORMAT + self.RESET
-            elif "[BZ-REQ]" in record.msg:
-                log_fmt = self.GREEN + self.FORMAT + self.RESET
-            elif "[BZ-RES]" in record.msg:
-                log_fmt = self.GREEN + self.FORMAT + self.RESET
+    # Messages starting with one of these tags are colored accordingly.
+    TAG_COLORS = {
+        "[LLM-REQ]": CYAN,
+        "[LLM-RES]": CYAN,
+        "[BZ-REQ]": GREEN,
+        "[BZ-RES]": GREEN,
+    }
+
+    def __init__(self):
+        super().__init__(self.FORMAT)
+        # Build every variant once rather than a new Formatter per record.
+        self._error_formatter = logging.Formatter(self.RED + self.FORMAT + self.RESET)
+        self._tag_formatters = {
+            tag: logging.Formatter(color + self.FORMAT + self.RESET)
+            for tag, color in self.TAG_COLORS.items()
+        }
 
+    def format(self, record):
         if record.levelno >= logging.ERROR:
-            log_fmt = self.RED + self.FORMAT + self.RESET
+            return self._error_formatter.format(record)
+        msg = record.msg
+        if isinstance(msg, str) and msg.startswith("["):
+            formatter = self._tag_formatters.get(msg[: msg.find("]") + 1])
+            if formatter is not None:
+                return formatter.format(record)
+        return super().format(record)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to its caller.
 
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+    The stock handler flushes (one write syscall) after every record;
+    BatchingQueueListener instead flushes once per burst of records.
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
-handler = logging.StreamHandler()
+class BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers once the queue drains.
+
+    Records logged in quick succession are written out together, while an
+    error, or the last record of a burst, still reaches the stream immediately.
+    """
+
+    def handle(self, record):
+        super().handle(record)
+        if record.levelno >= logging.ERROR or self.queue.empty():
+            self.flush()
+
+    def flush(self):
+        for h in self.handlers:
+            h.flush()
+
+    def stop(self):
+        # The stop sentinel keeps the queue non-empty behind the final record.
+        super().stop()
+        self.flush()
+
+
+def _log_stream():
+    """A 64 KiB buffered text stream on stderr's file descriptor, or stderr itself."""
+    try:
+        return open(
+            sys.stderr.fileno(),
+            "w",
+            buffering=64 * 1024,
+            encoding=sys.stderr.encoding,
+            errors="backslashreplace",
+            closefd=False,
+        )
+    except (AttributeError, OSError, ValueError):
+        # No real file descriptor behind stderr (e.g. captured or replaced).
+        return sys.stderr
+
+
+# Until start_log_listener() runs (e.g. when imported as a library or under
+# tests) records are written straight to stderr on the calling thread.
+_direct_handler = logging.StreamHandler()
+_direct_handler.setFormatter(ColorFormatter())
+
+handler = BufferedStreamHandler(_log_stream())
 handler.setFormatter(ColorFormatter())
 
+_log_queue = queue.SimpleQueue()
+log_listener = BatchingQueueListener(_log_queue, handler)
+
 mcp_log = logging.getLogger("bugzilla-mcp")
 mcp_log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
-mcp_log.addHandler(handler)
+mcp_log.addHandler(_direct_handler)
 mcp_log.propagate = False
 
 
+def start_log_listener() -> None:
+    """Route mcp_log through the background listener thread.
+
+    The calling thread still interpolates each message (QueueHandler.prepare);
+    the listener applies ColorFormatter and batches the writes to stderr.
+    Calling this more than once is a no-op.
+    """
+    if _direct_handler not in mcp_log.handlers:
+        return
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    mcp_log.addHandler(QueueHandler(_log_queue))
+    mcp_log.removeHandler(_direct_handler)
+
+
 class BugzillaAPIError(Exception):
     """Bugzilla REST API error with code and message."""
 
@@ -73,7 +169,7 @@ class BugzillaAPIError(Exception):
 def _bugzilla_error_body(response: httpx.Response) -> Optional[dict[str, Any]]:
     """Parse Bugzilla error from response body, if present."""
     try:
-        body = response.json()
+        body = orjson.loads(response.content)
         if isinstance(body, dict) and body.get("error") and "message" in body:
             return body
     except Exception:
@@ -81,40 +177,132 @@ def _bugzilla_error_body(response: httpx.Response) -> Optional[dict[str, Any]]:
     return None
 
 
+def new_http_client(
+    base_url: str, max_connections: int = 100, max_keepalive_connections: int = 20
+) -> httpx.AsyncClient:
+    """Create an httpx client for the Bugzilla REST API at ``base_url``.
+
+    The client carries no credentials, so one instance can be shared by every
+    request (keeping its connections alive); ``BugzillaAuth`` adds the key per call.
+    Its cookie jar refuses every cookie, so a ``Set-Cookie`` answered to one
+    user's request is never replayed on another's.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=30.0,
+    )
+    return httpx.AsyncClient(
+        base_url=f"{base_url.rstrip('/')}/rest",
+        timeout=30.0,
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+        cookies=http.cookiejar.CookieJar(
+            policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        ),
+        # HTTP/2 multiplexes concurrent calls (e.g. bugzilla_info's gather)
+        # over a single connection; servers without it negotiate HTTP/1.1.
+        transport=RetryTransport(
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=limits)
+        ),
+    )
+
+
+class BugzillaAuth(httpx.Auth):
+    """Attach a Bugzilla API key to an outgoing request.
+
+    The key is sent as the ``api_key`` query parameter, or as an
+    ``Authorization: Bearer`` header when ``use_auth_header`` is set.
+    """
+
+    def __init__(self, api_key: str, use_auth_header: bool = False):
+        self.api_key = api_key
+        self.use_auth_header = use_auth_header
+
+    def auth_flow(self, request: httpx.Request):
+        if self.use_auth_header:
+            request.headers["Authorization"] = f"Bearer {self.api_key}"
+        else:
+            request.url = request.url.copy_merge_params({"api_key": self.api_key})
+        yield request
+
+
+# Shared read-only default for lookups into decoded responses, so a missing key
+# does not allocate a fresh dict on every call.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# True for private comments. Comments may omit the flag, which rules out a bare
+# itemgetter; a try/except wrapper around one would put a Python frame back on
+# every comment, while methodcaller keeps the whole check in C.
+_is_private = methodcaller("get", "is_private")
+
+# Requests currently in flight, keyed by what they fetch (see single_flight)
+_inflight: dict[Hashable, asyncio.Future] = {}
+
+
+async def single_flight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``fetch()`` once for all concurrent callers asking for ``key``.
+
+    Callers arriving while a fetch for the same key is still running await its
+    result instead of sending their own request; the key is forgotten as soon
+    as the fetch completes, so nothing is cached beyond that. Keys must include
+    everything the response depends on, credentials in particular. Every caller
+    receives the same result object, so callers must copy it before mutating.
+    """
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(fetch())
+        _inflight[key] = fut
+
+        def settle(done: asyncio.Future) -> None:
+            _inflight.pop(key, None)
+            # If every caller was cancelled nobody awaits the fetch; retrieve its
+            # exception here so asyncio does not report it as never retrieved.
+            if not done.cancelled():
+                done.exception()
+
+        fut.add_done_callback(settle)
+    # shield(): one caller being cancelled must not cancel the shared fetch.
+    return await asyncio.shield(fut)
+
+
 class Bugzilla:
     """Async Bugzilla API client"""
 
-    def __init__(self, url: str, api_key: str = "", use_auth_header: bool = False):
-        self.base_url = url.rstrip("/")
-        self.api_url = f"{self.base_url}/rest"
+    def __init__(
+        self,
+        url: str,
+        api_key: str = "",
+        use_auth_header: bool = False,
+        client: Optional[httpx.AsyncClient] = None,
+        api_url: str = "",
+    ):
+        # Callers that build many instances (the server, once per request) pass
+        # an already normalized ``url`` together with its precomputed ``api_url``.
+        if api_url:
+            self.base_url = url
+            self.api_url = api_url
+        else:
+            self.base_url = url.rstrip("/")
+            self.api_url = f"{self.base_url}/rest"
         self.api_key = api_key
-        params = {}
-        headers = {"Content-Type": "application/json", "Accept": "application/json"}
         # Only attach auth credentials when a non-empty key is provided;
         # an empty key means anonymous access (no api_key param or Authorization header).
-        if api_key:
-            if use_auth_header:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            else:
-                params["api_key"] = api_key
-        # We'll use a single client for the instance
-        self.client = httpx.AsyncClient(
-            base_url=self.api_url,
-            params=params,
-            timeout=30.0,
-            headers=headers,
-            transport=RetryTransport(),
-        )
+        self.auth = BugzillaAuth(api_key, use_auth_header) if api_key else None
+        # Use the shared client when one is given (it is closed by its owner),
+        # otherwise create a private one that close() disposes of.
+        self._owns_client = client is None
+        self.client = new_http_client(self.base_url) if client is None else client
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def server_version(self) -> str:
         """Fetch bugzilla server version"""
         try:
-            r = await self.client.get("/version")
+            r = await self.client.get("/version", auth=self.auth)
             r.raise_for_status()
-            return r.json()["version"]
+            return orjson.loads(r.content)["version"]
 
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -133,10 +321,10 @@ class Bugzilla:
         try:
             # Fetch everything concurrently
             version_r, extensions_r, time_r, parameters_r = await asyncio.gather(
-                self.client.get("/version"),
-                self.client.get("/extensions"),
-                self.client.get("/time"),
-                self.client.get("/parameters"),
+                self.client.get("/version", auth=self.auth),
+                self.client.get("/extensions", auth=self.auth),
+                self.client.get("/time", auth=self.auth),
+                self.client.get("/parameters", auth=self.auth),
             )
 
             # Raise for status on all
@@ -144,10 +332,10 @@ class Bugzilla:
                 r.raise_for_status()
 
             # Combine results
-            version_data = version_r.json()
-            extensions_data = extensions_r.json()
-            time_data = time_r.json()
-            parameters_data = parameters_r.json()
+            version_data = orjson.loads(version_r.content)
+            extensions_data = orjson.loads(extensions_r.content)
+            time_data = orjson.loads(time_r.content)
+            parameters_data = orjson.loads(parameters_r.content)
 
             result = {
                 "url": self.base_url,
@@ -174,6 +362,18 @@ class Bugzilla:
     async def bug_info(self, ids: set[int]) -> dict[str, Any]:
         """Get information about a given bug or list of bugs"""
 
+        envelope = await single_flight(
+            ("bug_info", self.api_url, self.api_key, frozenset(ids)),
+            lambda: self._bug_info(ids),
+        )
+        # Coalesced callers share one envelope; give each its own copy of the
+        # envelope, the bug list and every bug (nested values stay shared).
+        bugs = envelope.get("bugs")
+        if bugs is None:
+            return dict(envelope)
+        return {**envelope, "bugs": [dict(bug) for bug in bugs]}
+
+    async def _bug_info(self, ids: set[int]) -> dict[str, Any]:
         if len(ids) == 1:
             url = f"/bug/{next(iter(ids))}"
             params = {}
@@ -181,10 +381,10 @@ class Bugzilla:
             url = "/bug"
             params = {"id": ",".join(str(i) for i in ids)}
 
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}{url} params={params}")
+        mcp_log.info("[BZ-REQ] GET %s%s params=%s", self.api_url, url, params)
 
         try:
-            r = await self.client.get(url, params=params)
+            r = await self.client.get(url, params=params, auth=self.auth)
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -195,10 +395,10 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        envelope = r.json()
-        bugs = envelope.get("bugs", [])
-        mcp_log.info(f"[BZ-RES] Retrieved {len(bugs)} bugs")
-        mcp_log.debug(f"[BZ-RES] {envelope}")
+        envelope = orjson.loads(r.content)
+        bugs = envelope.get("bugs")
+        mcp_log.info(f"[BZ-RES] Retrieved {len(bugs) if bugs else 0} bugs")
+        mcp_log.debug("[BZ-RES] %s", envelope)
         return envelope
 
     async def bug_history(
@@ -210,10 +410,10 @@ class Bugzilla:
         if new_since:
             params["new_since"] = new_since.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}{url} params={params}")
+        mcp_log.info("[BZ-REQ] GET %s%s params=%s", self.api_url, url, params)
 
         try:
-            r = await self.client.get(url, params=params)
+            r = await self.client.get(url, params=params, auth=self.auth)
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -224,26 +424,55 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        data = r.json().get("bugs", [])
-        history = data[0].get("history", []) if data else []
+        bugs = orjson.loads(r.content).get("bugs")
+        history = (bugs[0].get("history") or []) if bugs else []
         mcp_log.info(f"[BZ-RES] Found {len(history)} history items")
-        mcp_log.debug(f"[BZ-RES] {history}")
+        mcp_log.debug("[BZ-RES] %s", history)
         return history
 
     async def bug_comments(
-        self, bug_id: int, new_since: Optional[datetime] = None
+        self,
+        bug_id: int,
+        new_since: Optional[datetime] = None,
+        include_private: bool = True,
     ) -> list[dict[str, Any]]:
-        """Get comments of a bug"""
+        """Get comments of a bug, optionally leaving out private ones"""
         url = f"/bug/{bug_id}/comment"
         params = {}
         if new_since:
             params["new_since"] = new_since.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}{url} params={params}")
+        mcp_log.info("[BZ-REQ] GET %s%s params=%s", self.api_url, url, params)
+
+        # The response structure is {"bugs": {"<id>": {"comments": [...]}}}.
+        # It is parsed as it streams in, so only the comments we keep are held
+        # rather than the whole document: the REST API has no privacy filter,
+        # and private comments are dropped chunk by chunk.
+        data: list[dict[str, Any]] = []
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(
+            parsed, f"bugs.{bug_id}.comments.item", use_float=True
+        )
+
+        def collect():
+            if include_private:
+                data.extend(parsed)
+            else:
+                data.extend(filterfalse(_is_private, parsed))
+            del parsed[:]
 
         try:
-            r = await self.client.get(url, params=params)
-            r.raise_for_status()
+            async with self.client.stream(
+                "GET", url, params=params, auth=self.auth
+            ) as r:
+                if r.is_error:
+                    await r.aread()  # so the error log below can show the body
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes():
+                    parser.send(chunk)
+                    collect()
+            parser.close()
+            collect()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
                 f"[BZ-RES] Failed: {e.response.status_code} {e.response.text}"
@@ -253,10 +482,8 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        # The response structure is {"bugs": {"<id>": {"comments": [...]}}}
-        data = r.json().get("bugs", {}).get(str(bug_id), {}).get("comments", [])
         mcp_log.info(f"[BZ-RES] Found {len(data)} comments")
-        mcp_log.debug(f"[BZ-RES] {data}")
+        mcp_log.debug("[BZ-RES] %s", data)
         return data
 
     async def add_comment(
@@ -265,10 +492,12 @@ class Bugzilla:
         """Add a comment to bug, which can optionally be private"""
         payload = {"comment": comment, "is_private": is_private}
         url = f"/bug/{bug_id}/comment"
-        mcp_log.info(f"[BZ-REQ] POST {self.api_url}{url} json={payload}")
+        mcp_log.info("[BZ-REQ] POST %s%s json=%s", self.api_url, url, payload)
 
         try:
-            r = await self.client.post(url, json=payload)
+            r = await self.client.post(
+                url, content=orjson.dumps(payload), auth=self.auth
+            )
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -279,29 +508,38 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        data = r.json()
+        data = orjson.loads(r.content)
         mcp_log.info("[BZ-RES] Comment added successfully")
-        mcp_log.debug(f"[BZ-RES] {data}")
+        mcp_log.debug("[BZ-RES] %s", data)
         return data
 
     async def quicksearch(
-        self, query: str, include_fields: str, limit: int, offset: int
+        self,
+        query: str,
+        include_fields: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> dict[str, Any]:
-        """Perform a quicksearch"""
+        """Perform a quicksearch.
+
+        ``include_fields`` is a comma-separated field list; Bugzilla returns
+        every field of each bug when it is omitted.
+        """
         # Quicksearch isn't a direct REST endpoint usually, but /bug with quicksearch param works
 
         params = {
             "quicksearch": query,
-            "include_fields": include_fields,
             "limit": limit,
             "offset": offset,
             "order": "relevance",
         }
+        if include_fields:
+            params["include_fields"] = include_fields
 
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}/bug params={params}")
+        mcp_log.info("[BZ-REQ] GET %s/bug params=%s", self.api_url, params)
 
         try:
-            r = await self.client.get("/bug", params=params)
+            r = await self.client.get("/bug", params=params, auth=self.auth)
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -312,9 +550,9 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        envelope = r.json()
-        bugs = envelope.get("bugs", [])
-        mcp_log.info(f"[BZ-RES] Found {len(bugs)} bugs")
+        envelope = orjson.loads(r.content)
+        bugs = envelope.get("bugs")
+        mcp_log.info(f"[BZ-RES] Found {len(bugs) if bugs else 0} bugs")
         return envelope
 
     async def update_bug(
@@ -326,10 +564,12 @@ class Bugzilla:
             payload["comment"] = {"body": comment}
 
         url = f"/bug/{bug_id}"
-        mcp_log.info(f"[BZ-REQ] PUT {self.api_url}{url} json={payload}")
+        mcp_log.info("[BZ-REQ] PUT %s%s json=%s", self.api_url, url, payload)
 
         try:
-            r = await self.client.put(url, json=payload)
+            r = await self.client.put(
+                url, content=orjson.dumps(payload), auth=self.auth
+            )
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             if (bz_error := _bugzilla_error_body(e.response)) is not None:
@@ -346,9 +586,9 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        data = r.json()
+        data = orjson.loads(r.content)
         mcp_log.info("[BZ-RES] Bug updated successfully")
-        mcp_log.debug(f"[BZ-RES] {data}")
+        mcp_log.debug("[BZ-RES] %s", data)
         return data
 
     async def create_bug(self, fields: dict[str, Any]) -> dict[str, Any]:
@@ -359,10 +599,12 @@ class Bugzilla:
         a missing required field) is surfaced to the caller.
         """
         url = "/bug"
-        mcp_log.info(f"[BZ-REQ] POST {self.api_url}{url} json={fields}")
+        mcp_log.info("[BZ-REQ] POST %s%s json=%s", self.api_url, url, fields)
 
         try:
-            r = await self.client.post(url, json=fields)
+            r = await self.client.post(
+                url, content=orjson.dumps(fields), auth=self.auth
+            )
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -373,9 +615,9 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        data = r.json()
+        data = orjson.loads(r.content)
         mcp_log.info(f"[BZ-RES] Created bug {data.get('id')}")
-        mcp_log.debug(f"[BZ-RES] {data}")
+        mcp_log.debug("[BZ-RES] %s", data)
         return data
 
     async def add_attachment(
@@ -385,11 +627,16 @@ class Bugzilla:
         url = f"/bug/{bug_id}/attachment"
         # Don't log the (possibly large / binary) base64 blob.
         mcp_log.info(
-            f"[BZ-REQ] POST {self.api_url}{url} file_name={payload.get('file_name')!r}"
+            "[BZ-REQ] POST %s%s file_name=%r",
+            self.api_url,
+            url,
+            payload.get("file_name"),
         )
 
         try:
-            r = await self.client.post(url, json=payload)
+            r = await self.client.post(
+                url, content=orjson.dumps(payload), auth=self.auth
+            )
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -400,18 +647,20 @@ class Bugzilla:
             mcp_log.error(f"[BZ-RES] Network Error: {e}")
             raise
 
-        data = r.json()
+        data = orjson.loads(r.content)
         mcp_log.info(f"[BZ-RES] Attachment(s) {data.get('ids')} added to bug {bug_id}")
-        mcp_log.debug(f"[BZ-RES] {data}")
+        mcp_log.debug("[BZ-RES] %s", data)
         return data
 
     async def list_attachments(self, bug_id: int) -> list[dict[str, Any]]:
         """List a bug's attachments (metadata only, base64 ``data`` excluded)."""
         url = f"/bug/{bug_id}/attachment"
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}{url} exclude_fields=data")
+        mcp_log.info("[BZ-REQ] GET %s%s exclude_fields=data", self.api_url, url)
 
         try:
-            r = await self.client.get(url, params={"exclude_fields": "data"})
+            r = await self.client.get(
+                url, params={"exclude_fields": "data"}, auth=self.auth
+            )
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -423,7 +672,7 @@ class Bugzilla:
             raise
 
         # /bug/{id}/attachment returns {"bugs": {"<bug_id>": [ {att}, ... ]}}
-        attachments = r.json().get("bugs", {}).get(str(bug_id), [])
+        attachments = orjson.loads(r.content).get("bugs", _EMPTY).get(str(bug_id)) or []
         mcp_log.info(f"[BZ-RES] Bug {bug_id} has {len(attachments)} attachment(s)")
         return attachments
 
@@ -431,10 +680,10 @@ class Bugzilla:
         """Fetch a single attachment, including its base64-encoded ``data``."""
         url = f"/bug/attachment/{attachment_id}"
         # Don't log the (possibly large / binary) base64 blob in the response.
-        mcp_log.info(f"[BZ-REQ] GET {self.api_url}{url}")
+        mcp_log.info("[BZ-REQ] GET %s%s", self.api_url, url)
 
         try:
-            r = await self.client.get(url)
+            r = await self.client.get(url, auth=self.auth)
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
             mcp_log.error(
@@ -446,7 +695,9 @@ class Bugzilla:
             raise
 
         # /bug/attachment/{id} returns {"attachments": {"<attachment_id>": {att}}}
-        attachment = r.json().get("attachments", {}).get(str(attachment_id))
+        attachment = (
+            orjson.loads(r.content).get("attachments", _EMPTY).get(str(attachment_id))
+        )
         if attachment is None:
             raise ValueError(f"Attachment {attachment_id} not found")
         mcp_log.info(
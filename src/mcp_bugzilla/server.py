@@ -6,23 +6,77 @@ Author: Sai Karthik <kskarthik@disroot.org>
 License: Apache 2.0
 """
 
+import asyncio
 import base64
+import functools
 import importlib.metadata
+import logging
 import os
+import reprlib
 import tempfile
+import time
 from argparse import Namespace
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, List, Literal, Optional, TypedDict, Union
+from types import MappingProxyType
+from typing import Any, List, Literal, Mapping, Optional, TypedDict, Union
 
+import httpx
 from fastmcp import FastMCP
 from fastmcp.dependencies import CurrentHeaders, Depends
 from fastmcp.exceptions import PromptError, ResourceError, ToolError
+from fastmcp.server.dependencies import get_http_request
+
+from .mcp_utils import (
+    Bugzilla,
+    is_textual,
+    mcp_log,
+    new_http_client,
+    safe_filename,
+    single_flight,
+    start_log_listener,
+)
+
+
+async def warm_connection(client: httpx.AsyncClient):
+    """Open the first Bugzilla connection before a tool call needs it.
+
+    Any response will do: the point is to get the TCP/TLS handshake out of the
+    way, so failures are only logged.
+    """
+    try:
+        await client.head("/version")
+    except Exception as e:
+        mcp_log.debug("Bugzilla connection warm-up failed: %s", e)
+    else:
+        mcp_log.info("Bugzilla connection warmed")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Own the shared Bugzilla HTTP client for the lifetime of the server.
+
+    Every request reuses its connection pool instead of opening (and TLS
+    handshaking) a new connection per tool call. The pool is warmed in the
+    background so startup does not wait on Bugzilla.
+    """
+    global http_client
+    http_client = new_http_client(
+        base_url,
+        max_connections=getattr(cli_args, "bugzilla_max_connections", 100),
+        max_keepalive_connections=getattr(cli_args, "bugzilla_max_keepalive", 20),
+    )
+    warmup = asyncio.create_task(warm_connection(http_client))
+    try:
+        yield {}
+    finally:
+        warmup.cancel()
+        await http_client.aclose()
+        http_client = None
 
-from .mcp_utils import Bugzilla, is_textual, mcp_log, safe_filename
 
 # The FastMCP instance
-mcp = FastMCP("Bugzilla")
+mcp = FastMCP("Bugzilla", lifespan=lifespan)
 
 # Global dict to hold command-line arguments, populated by main() in __init__.py
 cli_args: Namespace = Namespace()
@@ -30,6 +84,37 @@ cli_args: Namespace = Namespace()
 # Global variable to hold the base_url, set by the start() function
 base_url: str = ""
 
+# REST root derived from base_url, set by the start() function
+api_url: str = ""
+
+# Fixed web UI URLs derived from base_url, set by the start() function
+bug_url_prefix: str = ""
+quicksearch_syntax_url: str = ""
+
+# Shared httpx client for Bugzilla REST calls, managed by lifespan()
+http_client: Optional[httpx.AsyncClient] = None
+
+# Lowercased, latin-1 encoded --mcp-auth-header name (b"" when disabled), matched
+# against raw ASGI header names; set by the start() function
+mcp_auth_header: bytes = b""
+
+# Installed package version; resolving it walks the distribution metadata
+try:
+    MCP_VERSION = importlib.metadata.version("mcp-bugzilla")
+except importlib.metadata.PackageNotFoundError:
+    # Running from a checkout that was never installed
+    MCP_VERSION = "unknown"
+
+# Read-only snapshot of cli_args plus mcp_version, set by the start() function
+server_info: Mapping[str, Any] = MappingProxyType({})
+
+# Complete mcp_server_info_resource result, built by a call that reaches
+# Bugzilla and kept as (time.monotonic() timestamp, info) for SERVER_INFO_TTL
+# seconds, so a Bugzilla upgrade shows up without a restart; reset by the
+# start() function
+SERVER_INFO_TTL: float = 60 * 60
+server_info_cache: Optional[tuple[float, Mapping[str, Any]]] = None
+
 # Global variable for read-only mode
 read_only: bool = False
 
@@ -37,6 +122,22 @@ read_only: bool = False
 # set by the start() function from --download-dir / BUGZILLA_DOWNLOAD_DIR.
 download_dir: str = ""
 
+# Upper bound on Bugzilla requests a single batch tool (bug_comments_many) keeps
+# in flight; the rest wait for a free slot.
+MAX_CONCURRENT_REQUESTS: int = 16
+
+# Fields bugs_quicksearch asks Bugzilla for when the caller does not choose any;
+# the full record of a bug is one bug_info call away.
+QUICKSEARCH_FIELDS: str = (
+    "id,product,component,assigned_to,status,resolution,summary,last_change_time"
+)
+
+# The quicksearch syntax page only changes when Bugzilla is upgraded; the last
+# fetch is kept as (time.monotonic() timestamp, html) for QUICKSEARCH_SYNTAX_TTL
+# seconds.
+QUICKSEARCH_SYNTAX_TTL: float = 7 * 24 * 60 * 60
+quicksearch_syntax_cache: Optional[tuple[float, str]] = None
+
 # In "auto" delivery, attachments whose decoded size (in bytes) is at or below this
 # limit are returned inline; anything larger (or any binary attachment) is written
 # to disk. The check is on byte length, matching the reported ``size`` field.
@@ -46,9 +147,38 @@ MAX_INLINE_BYTES: int = 256 * 1024
 # response (it would flood the conversation); the caller should save it instead.
 MAX_FORCED_INLINE_BYTES: int = 1024 * 1024
 
+# Body of summarize_bug_prompt; the comments are filled in one per line as
+# "- <creator> @ <time>: <text>", leaving out fields the summary does not use.
+SUMMARY_PROMPT_TEMPLATE: str = """\
+You are an expert in summarizing bugzilla comments.
+Rules to follow:
+- Summary must be well structured & eye catching
+- Mention usernames & dates wherever relevant.
+- date field must be in human readable format
+- Usernames must be bold italic (***username***) dates must be bold (**date**)
+
+Comments Data:
+{comments}"""
+
+
+def request_header(name: bytes) -> Optional[str]:
+    """Value of header ``name`` (lowercase) on the current HTTP request, if any.
+
+    Scans the raw ASGI header pairs instead of materializing every header into
+    a dict the way CurrentHeaders() does; returns None outside an HTTP request.
+    """
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return None
+    for key, value in request.scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
 
 @asynccontextmanager
-async def get_bz(headers: dict = CurrentHeaders()) -> Bugzilla:
+async def get_bz() -> Bugzilla:
     """Dependency to get the current Bugzilla client.
 
     For http transport, the API key is read per-request from the configured header
@@ -67,9 +197,13 @@ async def get_bz(headers: dict = CurrentHeaders()) -> Bugzilla:
         api_key_value = getattr(cli_args, "bugzilla_api_key", None) or ""
     else:
         # Per-request header is the primary source for http transport if set.
-        mcp_auth_header = getattr(cli_args, "mcp_auth_header", None)
         if mcp_auth_header:
-            api_key_value = headers.get(mcp_auth_header.lower()) or ""
+            api_key_value = request_header(mcp_auth_header) or ""
+            if mcp_auth_header == b"authorization":
+                # "Authorization: Bearer <key>": only the credentials are the key.
+                scheme, _, credentials = api_key_value.partition(" ")
+                if scheme.lower() == "bearer":
+                    api_key_value = credentials.strip()
         else:
             api_key_value = ""
         # Fall back to the static key if the client did not send one.
@@ -86,6 +220,8 @@ async def get_bz(headers: dict = CurrentHeaders()) -> Bugzilla:
         url=base_url,
         api_key=api_key_value,
         use_auth_header=use_bearer,
+        client=http_client,
+        api_url=api_url,
     )
     try:
         yield bz
@@ -93,24 +229,57 @@ async def get_bz(headers: dict = CurrentHeaders()) -> Bugzilla:
         await bz.close()
 
 
+def log_and_wrap(err_cls: type[Exception], message: str):
+    """Log an [LLM-REQ] line for a tool call and translate its failures.
+
+    ``message`` is formatted with the caught exception as ``{e}`` and raised as
+    ``err_cls``. MCP errors raised on purpose by the tool body (validation and
+    the like) propagate unchanged.
+    """
+
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if mcp_log.isEnabledFor(logging.INFO):
+                mcp_log.info(
+                    "[LLM-REQ] %s(%s)",
+                    name,
+                    ", ".join(
+                        [reprlib.repr(a) for a in args]
+                        + [
+                            f"{k}={reprlib.repr(v)}"
+                            for k, v in kwargs.items()
+                            if k != "bz"
+                        ]
+                    ),
+                )
+            try:
+                return await fn(*args, **kwargs)
+            except (ToolError, ResourceError, PromptError):
+                raise
+            except Exception as e:
+                raise err_cls(message.format(e=e)) from e
+
+        return wrapper
+
+    return decorator
+
+
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Failed to fetch bug info\nReason: {e}")
 async def bug_info(bug_ids: set[int], bz: Bugzilla = Depends(get_bz)) -> dict[str, Any]:
     """Returns the entire information for one or more bugzilla bug ids."""
 
-    mcp_log.info(f"[LLM-REQ] bug_info(ids={bug_ids})")
-
     if not bug_ids:
         raise ToolError("No bug IDs provided")
 
-    try:
-        result = await bz.bug_info(bug_ids)
-        return result
-
-    except Exception as e:
-        raise ToolError(f"Failed to fetch bug info\nReason: {e}")
+    return await bz.bug_info(bug_ids)
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Failed to fetch bug history\nReason: {e}")
 async def bug_history(
     id: int,
     new_since: Optional[datetime] = None,
@@ -120,17 +289,13 @@ async def bug_history(
     new_since allows filtering history newer than the given date.
     """
 
-    mcp_log.info(f"[LLM-REQ] bug_history(id={id}, new_since={new_since})")
-
-    try:
-        history = await bz.bug_history(id, new_since=new_since)
-        mcp_log.info(f"[LLM-RES] Returning {len(history)} history items")
-        return history
-    except Exception as e:
-        raise ToolError(f"Failed to fetch bug history\nReason: {e}")
+    history = await bz.bug_history(id, new_since=new_since)
+    mcp_log.info("[LLM-RES] Returning %d history items", len(history))
+    return history
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Failed to fetch bug comments\nReason: {e}")
 async def bug_comments(
     id: int,
     include_private_comments: bool = False,
@@ -143,51 +308,76 @@ async def bug_comments(
     new_since allows filtering comments newer than the given date.
     """
 
-    mcp_log.info(
-        f"[LLM-REQ] bug_comments(id={id}, include_private_comments={include_private_comments}, new_since={new_since})"
+    comments = await bz.bug_comments(
+        id, new_since=new_since, include_private=include_private_comments
     )
 
-    try:
-        all_comments = await bz.bug_comments(id, new_since=new_since)
+    if include_private_comments:
+        mcp_log.info(
+            "[LLM-RES] Returning %d comments (including private)", len(comments)
+        )
+    else:
+        mcp_log.info("[LLM-RES] Returning %d public comments", len(comments))
+    return comments
 
-        if include_private_comments:
-            mcp_log.info(
-                f"[LLM-RES] Returning {len(all_comments)} comments (including private)"
+
+@mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Failed to fetch bug comments\nReason: {e}")
+async def bug_comments_many(
+    ids: set[int],
+    include_private_comments: bool = False,
+    new_since: Optional[datetime] = None,
+    bz: Bugzilla = Depends(get_bz),
+) -> dict[str, dict[str, Any]]:
+    """Returns the comments of several bugs at once, fetched concurrently.
+    Same filtering as bug_comments. The result maps each bug id to its comments
+    under "comments"; bugs that could not be fetched are listed under "errors"
+    with the reason instead of failing the whole call.
+    """
+
+    if not ids:
+        raise ToolError("No bug IDs provided")
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def one(bug_id: int) -> list[dict[str, Any]]:
+        async with sem:
+            return await bz.bug_comments(
+                bug_id, new_since=new_since, include_private=include_private_comments
             )
-            return all_comments
 
-        public_comments = [c for c in all_comments if not c.get("is_private", False)]
-        mcp_log.info(f"[LLM-RES] Returning {len(public_comments)} public comments")
-        return public_comments
+    results = await asyncio.gather(*[one(i) for i in ids], return_exceptions=True)
 
-    except Exception as e:
-        raise ToolError(f"Failed to fetch bug comments\nReason: {e}")
+    comments: dict[str, Any] = {}
+    errors: dict[str, Any] = {}
+    for bug_id, result in zip(ids, results):
+        if isinstance(result, BaseException):
+            errors[str(bug_id)] = str(result)
+        else:
+            comments[str(bug_id)] = result
+    mcp_log.info(
+        "[LLM-RES] Returning comments of %d bugs, %d failed", len(comments), len(errors)
+    )
+    return {"comments": comments, "errors": errors}
 
 
 @mcp.tool(
     annotations={"readOnlyHint": False, "destructiveHint": True, "openWorldHint": True},
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to create a comment\n{e}")
 async def add_comment(
     bug_id: int, comment: str, is_private: bool = False, bz: Bugzilla = Depends(get_bz)
 ) -> dict[str, int]:
     """Add a comment to a bug. It can optionally be private. If success, returns the created comment id."""
-    mcp_log.info(
-        f"[LLM-REQ] add_comment(bug_id={bug_id}, comment='{comment}', is_private={is_private})"
-    )
-    try:
-        result = await bz.add_comment(bug_id, comment, is_private)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to create a comment\n{e}")
+    return await bz.add_comment(bug_id, comment, is_private)
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Search failed: {e}")
 async def bugs_quicksearch(
     query: str,
-    include_fields: Optional[
-        str
-    ] = "id,product,component,assigned_to,status,resolution,summary,last_change_time",
+    include_fields: Optional[str] = QUICKSEARCH_FIELDS,
     limit: Optional[int] = 50,
     offset: Optional[int] = 0,
     bz: Bugzilla = Depends(get_bz),
@@ -199,86 +389,89 @@ async def bugs_quicksearch(
     Returns the top-level bug data envelope containing the matched bugs.
     """
 
-    mcp_log.info(
-        f"[LLM-REQ] bugs_quicksearch(query='{query}', include_fields='{include_fields}', limit={limit}, offset={offset})"
+    # We moved quicksearch logic to mcp_utils
+    envelope = await bz.quicksearch(
+        query,
+        include_fields=include_fields or QUICKSEARCH_FIELDS,
+        limit=limit or 50,
+        offset=offset or 0,
     )
 
-    try:
-        # We moved quicksearch logic to mcp_utils
-        envelope = await bz.quicksearch(
-            query,
-            include_fields
-            or "id,product,component,assigned_to,status,resolution,summary,last_change_time",
-            limit or 50,
-            offset or 0,
-        )
-
-        mcp_log.info("[LLM-RES] Returning quicksearch envelope")
-        return envelope
-
-    except Exception as e:
-        raise ToolError(f"Search failed: {e}")
+    mcp_log.info("[LLM-RES] Returning quicksearch envelope")
+    return envelope
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ResourceError, "Failed to fetch quicksearch documentation: {e}")
 async def quicksearch_syntax_resource(bz: Bugzilla = Depends(get_bz)) -> str:
     """Access the documentation of the bugzilla quicksearch syntax. LLM can learn using this tool. Response is in HTML"""
+    global quicksearch_syntax_cache
 
-    mcp_log.info("[LLM-REQ] quicksearch_syntax_resource()")
-
-    try:
-        # We can use the client to fetch this page too, though it's not a rest API
-        # Using the underlying client for convenience
-        url = f"{bz.base_url}/page.cgi"
-        r = await bz.client.get(
-            url, params={"id": "quicksearch.html"}
-        )  # Use absolute URL since base_url of client is /rest
-
-        if r.status_code != 200:
-            raise ResourceError(
-                f"Failed to fetch bugzilla quicksearch_syntax with status code {r.status_code}"
-            )
+    cached = quicksearch_syntax_cache
+    if cached and time.monotonic() - cached[0] < QUICKSEARCH_SYNTAX_TTL:
+        mcp_log.info(
+            "[LLM-RES] Returning %d chars of cached documentation", len(cached[1])
+        )
+        return cached[1]
+
+    # We can use the client to fetch this page too, though it's not a rest API
+    # Using the underlying client for convenience. The page is static
+    # documentation, the same for every key, so coalesce (and cache) by URL only.
+    r = await single_flight(
+        ("quicksearch_syntax", quicksearch_syntax_url),
+        lambda: bz.client.get(quicksearch_syntax_url, auth=bz.auth),
+    )  # Use absolute URL since base_url of client is /rest
+
+    if r.status_code != 200:
+        raise ResourceError(
+            f"Failed to fetch bugzilla quicksearch_syntax with status code {r.status_code}"
+        )
 
-        mcp_log.info(f"[LLM-RES] Fetched {len(r.text)} chars of documentation")
-        return r.text
-    except Exception as e:
-        raise ResourceError(f"Failed to fetch quicksearch documentation: {e}")
+    quicksearch_syntax_cache = (time.monotonic(), r.text)
+    mcp_log.info("[LLM-RES] Fetched %d chars of documentation", len(r.text))
+    return r.text
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(ToolError, "Failed to fetch bugzilla server info\nReason: {e}")
 async def bugzilla_server_info(bz: Bugzilla = Depends(get_bz)) -> dict[str, Any]:
     """Returns comprehensive bugzilla server information (url, version, extensions, timezone, time, parameters)."""
-    mcp_log.info("[LLM-REQ] bugzilla_server_info()")
-    try:
-        return await bz.bugzilla_info()
-    except Exception as e:
-        raise ToolError(f"Failed to fetch bugzilla server info\nReason: {e}")
+    return await bz.bugzilla_info()
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": False}, tags={"read"})
 def bug_url(bug_id: int) -> str:
     """returns the bug url"""
-    mcp_log.info(f"[LLM-REQ] bug_url(bug_id={bug_id})")
-    return f"{base_url}/show_bug.cgi?id={bug_id}"
+    mcp_log.info("[LLM-REQ] bug_url(bug_id=%s)", bug_id)
+    return bug_url_prefix + str(bug_id)
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
-async def mcp_server_info_resource(bz: Bugzilla = Depends(get_bz)) -> dict[str, Any]:
+async def mcp_server_info_resource() -> dict[str, Any]:
     """Returns the args being used by the current server instance"""
 
+    global server_info_cache
+
     mcp_log.info("[LLM-REQ] mcp_server_info_resource()")
 
-    info = vars(cli_args).copy()
+    # Checked before any per-request work: a cache hit needs no Bugzilla client.
+    cached = server_info_cache
+    if cached and time.monotonic() - cached[0] < SERVER_INFO_TTL:
+        return dict(cached[1])
 
-    info["mcp_version"] = importlib.metadata.version("mcp-bugzilla")
+    info = dict(server_info)
 
     try:
-        r = await bz.server_version()
-        info["bugzilla_server_version"] = r
+        async with get_bz() as bz:
+            info["bugzilla_server_version"] = await bz.server_version()
     except Exception as e:
-        mcp_log.info(f"[LLM-RES]: {e}")
+        # Not cached, so the next call tries to fetch the version again.
+        mcp_log.info("[LLM-RES]: %s", e)
+        return info
 
-    return info
+    # Callers each get their own copy; the cached one is read-only.
+    server_info_cache = (time.monotonic(), MappingProxyType(info))
+    return dict(info)
 
 
 @mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
@@ -288,32 +481,31 @@ def get_current_headers_resource(headers: dict = CurrentHeaders()) -> dict[str,
     return headers
 
 
-@mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
-async def summarize_bug_prompt(id: int, bz: Bugzilla = Depends(get_bz)) -> str:
-    """Summarizes all the comments of a bug"""
+def format_comment_line(comment: Mapping[str, Any]) -> str:
+    """Render a comment as one "- creator @ time: text" list item.
 
-    mcp_log.info(f"[LLM-REQ] summarize_bug_prompt(id={id})")
+    Missing fields get placeholders, and the lines of a multi-line text are
+    indented so they stay part of the same item.
+    """
+    text = "\n  ".join((comment.get("text") or "").splitlines())
+    creator = comment.get("creator") or "unknown"
+    when = comment.get("time") or "unknown time"
+    return f"- {creator} @ {when}: {text}"
 
-    try:
-        comments = await bz.bug_comments(id)
 
-        summary_prompt = f"""
-    You are an expert in summarizing bugzilla comments.
-    Rules to follow:
-    - Summary must be well structured & eye catching
-    - Mention usernames & dates wherever relevant.
-    - date field must be in human readable format
-    - Usernames must be bold italic (***username***) dates must be bold (**date**)
+@mcp.tool(annotations={"readOnlyHint": True, "openWorldHint": True}, tags={"read"})
+@log_and_wrap(PromptError, "Summarize Comments Failed\nReason: {e}")
+async def summarize_bug_prompt(id: int, bz: Bugzilla = Depends(get_bz)) -> str:
+    """Summarizes all the comments of a bug"""
 
-    Comments Data:
-    {comments}
-    """.strip()
+    comments = await bz.bug_comments(id)
 
-        mcp_log.info(f"[LLM-RES] Generated prompt of length {len(summary_prompt)}")
-        return summary_prompt
+    summary_prompt = SUMMARY_PROMPT_TEMPLATE.format(
+        comments="\n".join(map(format_comment_line, comments))
+    )
 
-    except Exception as e:
-        raise PromptError(f"Summarize Comments Failed\nReason: {e}")
+    mcp_log.info("[LLM-RES] Generated prompt of length %d", len(summary_prompt))
+    return summary_prompt
 
 
 @mcp.tool(
@@ -324,6 +516,7 @@ async def summarize_bug_prompt(id: int, bz: Bugzilla = Depends(get_bz)) -> str:
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to update bug status\n{e}")
 async def update_bug_status(
     bug_id: int,
     status: str,
@@ -342,10 +535,6 @@ async def update_bug_status(
         resolution: Resolution (required when status is CLOSED or RESOLVED)
         comment: Optional comment explaining the change
     """
-    mcp_log.info(
-        f"[LLM-REQ] update_bug_status(bug_id={bug_id}, status='{status}', resolution={resolution}, comment='{comment[:50] if comment else ''}...')"
-    )
-
     resolved_states = ("CLOSED", "RESOLVED", "VERIFIED")
 
     updates = {"status": status}
@@ -360,11 +549,7 @@ async def update_bug_status(
             f"Resolution is required when setting status to {status} (e.g., FIXED, WONTFIX, NOTABUG, DUPLICATE)"
         )
 
-    try:
-        result = await bz.update_bug(bug_id, updates, comment)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to update bug status\n{e}")
+    return await bz.update_bug(bug_id, updates, comment)
 
 
 @mcp.tool(
@@ -375,6 +560,7 @@ async def update_bug_status(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to assign bug\n{e}")
 async def assign_bug(
     bug_id: int, assignee: str, comment: str = "", bz: Bugzilla = Depends(get_bz)
 ) -> dict[str, Any]:
@@ -385,12 +571,7 @@ async def assign_bug(
         assignee: Email address of the assignee
         comment: Optional comment explaining the assignment
     """
-    mcp_log.info(f"[LLM-REQ] assign_bug(bug_id={bug_id}, assignee='{assignee}')")
-    try:
-        result = await bz.update_bug(bug_id, {"assigned_to": assignee}, comment)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to assign bug\n{e}")
+    return await bz.update_bug(bug_id, {"assigned_to": assignee}, comment)
 
 
 @mcp.tool(
@@ -401,6 +582,7 @@ async def assign_bug(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to update bug fields\n{e}")
 async def update_bug_fields(
     bug_id: int,
     priority: Optional[str] = None,
@@ -420,10 +602,6 @@ async def update_bug_fields(
         custom_fields: Dict of custom fields e.g. {"cf_fixed_in": "1.2.3"}
         comment: Optional comment explaining the changes
     """
-    mcp_log.info(
-        f"[LLM-REQ] update_bug_fields(bug_id={bug_id}, priority={priority}, severity={severity}, resolution={resolution})"
-    )
-
     updates = {}
     if priority:
         updates["priority"] = priority
@@ -437,11 +615,7 @@ async def update_bug_fields(
     if not updates:
         raise ToolError("At least one field must be specified")
 
-    try:
-        result = await bz.update_bug(bug_id, updates, comment)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to update bug fields\n{e}")
+    return await bz.update_bug(bug_id, updates, comment)
 
 
 @mcp.tool(
@@ -452,6 +626,7 @@ async def update_bug_fields(
         "openWorldHint": True,
     },
 )
+@log_and_wrap(ToolError, "Failed to update bug dependencies\n{e}")
 async def update_bug_dependencies(
     bug_id: int,
     blocks_add: Optional[list[int]] = None,
@@ -488,11 +663,7 @@ async def update_bug_dependencies(
     if not updates:
         raise ToolError("At least one dependency change must be specified")
 
-    try:
-        result = await bz.update_bug(bug_id, updates, comment)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to update bug dependencies\n{e}")
+    return await bz.update_bug(bug_id, updates, comment)
 
 
 @mcp.tool(
@@ -503,6 +674,7 @@ async def update_bug_dependencies(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to add CC\n{e}")
 async def add_cc_to_bug(
     bug_id: int, cc_email: str, bz: Bugzilla = Depends(get_bz)
 ) -> dict[str, Any]:
@@ -512,12 +684,7 @@ async def add_cc_to_bug(
         bug_id: Bug ID
         cc_email: Email address to add to CC list
     """
-    mcp_log.info(f"[LLM-REQ] add_cc_to_bug(bug_id={bug_id}, cc_email='{cc_email}')")
-    try:
-        result = await bz.update_bug(bug_id, {"cc": {"add": [cc_email]}}, "")
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to add CC\n{e}")
+    return await bz.update_bug(bug_id, {"cc": {"add": [cc_email]}}, "")
 
 
 @mcp.tool(
@@ -528,6 +695,7 @@ async def add_cc_to_bug(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to mark as duplicate\n{e}")
 async def mark_as_duplicate(
     bug_id: int, duplicate_of: int, comment: str = "", bz: Bugzilla = Depends(get_bz)
 ) -> dict[str, Any]:
@@ -538,20 +706,12 @@ async def mark_as_duplicate(
         duplicate_of: Bug ID this is a duplicate of
         comment: Optional comment (default: auto-generated)
     """
-    mcp_log.info(
-        f"[LLM-REQ] mark_as_duplicate(bug_id={bug_id}, duplicate_of={duplicate_of})"
-    )
-
     if not comment:
         comment = f"Marking as duplicate of bug {duplicate_of}"
 
     updates = {"status": "CLOSED", "resolution": "DUPLICATE", "dupe_of": duplicate_of}
 
-    try:
-        result = await bz.update_bug(bug_id, updates, comment)
-        return result
-    except Exception as e:
-        raise ToolError(f"Failed to mark as duplicate\n{e}")
+    return await bz.update_bug(bug_id, updates, comment)
 
 
 @mcp.tool(
@@ -562,6 +722,7 @@ async def mark_as_duplicate(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to create bug\n{e}")
 async def create_bug(
     product: str,
     component: str,
@@ -595,11 +756,6 @@ async def create_bug(
         cc: Optional list of email addresses to CC
         custom_fields: Optional dict of extra/custom fields, e.g. {"cf_foo": "bar"}
     """
-    mcp_log.info(
-        f"[LLM-REQ] create_bug(product={product!r}, component={component!r}, "
-        f"summary={summary!r}, version={version!r})"
-    )
-
     fields: dict[str, Any] = {
         "product": product,
         "component": component,
@@ -618,10 +774,7 @@ async def create_bug(
     if custom_fields:
         fields.update(custom_fields)
 
-    try:
-        return await bz.create_bug(fields)
-    except Exception as e:
-        raise ToolError(f"Failed to create bug\n{e}")
+    return await bz.create_bug(fields)
 
 
 @mcp.tool(
@@ -632,6 +785,7 @@ async def create_bug(
     },
     tags={"write"},
 )
+@log_and_wrap(ToolError, "Failed to add attachment\n{e}")
 async def add_attachment(
     bug_id: int,
     file_name: str,
@@ -655,11 +809,6 @@ async def add_attachment(
         is_private: Restrict the attachment to the insider group
         comment: Optional comment to add alongside the attachment
     """
-    mcp_log.info(
-        f"[LLM-REQ] add_attachment(bug_id={bug_id}, file_name={file_name!r}, "
-        f"is_patch={is_patch}, is_private={is_private})"
-    )
-
     payload: dict[str, Any] = {
         "ids": [bug_id],
         "file_name": file_name,
@@ -672,16 +821,14 @@ async def add_attachment(
     if comment:
         payload["comment"] = comment
 
-    try:
-        return await bz.add_attachment(bug_id, payload)
-    except Exception as e:
-        raise ToolError(f"Failed to add attachment\n{e}")
+    return await bz.add_attachment(bug_id, payload)
 
 
 @mcp.tool(
     annotations={"readOnlyHint": True, "openWorldHint": True},
     tags={"read"},
 )
+@log_and_wrap(ToolError, "Failed to list attachments\nReason: {e}")
 async def list_attachments(
     bug_id: int, bz: Bugzilla = Depends(get_bz)
 ) -> list[dict[str, Any]]:
@@ -698,11 +845,7 @@ async def list_attachments(
         A list of attachment metadata objects (id, file_name, summary,
         content_type, size, is_private, is_obsolete, is_patch, creation_time, ...).
     """
-    mcp_log.info(f"[LLM-REQ] list_attachments(bug_id={bug_id})")
-    try:
-        return await bz.list_attachments(bug_id)
-    except Exception as e:
-        raise ToolError(f"Failed to list attachments\nReason: {e}")
+    return await bz.list_attachments(bug_id)
 
 
 class _AttachmentMeta(TypedDict):
@@ -774,7 +917,9 @@ async def download_attachment(
         The on-disk file is named ``<attachment_id>-<sanitized file_name>``.
     """
     mcp_log.info(
-        f"[LLM-REQ] download_attachment(attachment_id={attachment_id}, delivery={delivery!r})"
+        "[LLM-REQ] download_attachment(attachment_id=%s, delivery=%r)",
+        attachment_id,
+        delivery,
     )
     try:
         att = await bz.get_attachment(attachment_id)
@@ -827,7 +972,7 @@ async def download_attachment(
                     f"Failed to write attachment {attachment_id} to {path!r}: {e}"
                 )
             abspath = os.path.abspath(path)
-            mcp_log.info(f"[LLM-RES] attachment {attachment_id} saved to {abspath}")
+            mcp_log.info("[LLM-RES] attachment %s saved to %s", attachment_id, abspath)
             return {"mode": "saved", "path": abspath, **meta}
 
         def _inline() -> Union[TextAttachment, Base64Attachment]:
@@ -846,16 +991,17 @@ async def download_attachment(
                     content = raw.decode("utf-8")
                 except UnicodeDecodeError:
                     mcp_log.info(
-                        f"[LLM-RES] attachment {attachment_id} is not valid UTF-8, "
-                        "returned inline as base64"
+                        "[LLM-RES] attachment %s is not valid UTF-8, "
+                        "returned inline as base64",
+                        attachment_id,
                     )
                     return {"mode": "base64", "data_base64": b64, **meta}
                 mcp_log.info(
-                    f"[LLM-RES] attachment {attachment_id} returned inline as text"
+                    "[LLM-RES] attachment %s returned inline as text", attachment_id
                 )
                 return {"mode": "text", "content": content, **meta}
             mcp_log.info(
-                f"[LLM-RES] attachment {attachment_id} returned inline as base64"
+                "[LLM-RES] attachment %s returned inline as base64", attachment_id
             )
             return {"mode": "base64", "data_base64": b64, **meta}
 
@@ -881,11 +1027,14 @@ def disable_components_selectively():
     Disables MCP components based on environment variables.
     Convention: MCP_BUGZILLA_DISABLED_METHODS=component1,component2
     """
-    import os
-
     # Comma-separated list in MCP_BUGZILLA_DISABLED_METHODS
-    disabled_list = os.getenv("MCP_BUGZILLA_DISABLED_METHODS", "").split(",")
-    disabled_list = [d.strip().upper() for d in disabled_list if d.strip()]
+    disabled = {
+        d.strip().upper()
+        for d in os.getenv("MCP_BUGZILLA_DISABLED_METHODS", "").split(",")
+        if d.strip()
+    }
+    if not disabled:
+        return
 
     # Iterate over all registered components in the local provider
     for key, component in mcp.local_provider._components.items():
@@ -895,8 +1044,10 @@ def disable_components_selectively():
 
         name_upper = name.upper()
 
-        if name_upper in disabled_list:
-            mcp_log.info(f"Disabling component {key} via MCP_BUGZILLA_DISABLED_METHODS")
+        if name_upper in disabled:
+            mcp_log.info(
+                "Disabling component %s via MCP_BUGZILLA_DISABLED_METHODS", key
+            )
             mcp.disable(keys={key})
 
 
@@ -915,8 +1066,20 @@ def start():
     """
     Starts the FastMCP server for Bugzilla.
     """
-    global base_url, read_only, download_dir
+    global base_url, api_url, bug_url_prefix, quicksearch_syntax_url
+    global mcp_auth_header, read_only, download_dir
+    global server_info, server_info_cache
+    # --log-level overrides the LOG_LEVEL the logger was created with; at WARNING
+    # or above the per-request INFO lines are dropped before any formatting.
+    log_level = getattr(cli_args, "log_level", None)
+    if log_level:
+        mcp_log.setLevel(log_level)
+    start_log_listener()
     base_url = cli_args.bugzilla_server
+    # Header names arrive lowercased; normalize ours once instead of per request.
+    mcp_auth_header = (
+        (getattr(cli_args, "mcp_auth_header", None) or "").lower().encode("latin-1")
+    )
     read_only = getattr(cli_args, "read_only", False)
     download_dir = getattr(cli_args, "download_dir", None) or os.path.join(
         tempfile.gettempdir(), "mcp-bugzilla"
@@ -924,6 +1087,12 @@ def start():
     # Ensure base_url doesn't have trailing slash for consistency
     if base_url.endswith("/"):
         base_url = base_url[:-1]
+    api_url = f"{base_url}/rest"
+    bug_url_prefix = f"{base_url}/show_bug.cgi?id="
+    quicksearch_syntax_url = f"{base_url}/page.cgi?id=quicksearch.html"
+    # cli_args does not change once the server runs; snapshot it for the info tool.
+    server_info = MappingProxyType({**vars(cli_args), "mcp_version": MCP_VERSION})
+    server_info_cache = None
 
     # Seletively disable components before running the server
     disable_components_selectively()
@@ -935,7 +1104,9 @@ def start():
 
     if transport != "stdio":
         run_kwargs.update({"host": cli_args.host, "port": cli_args.port})
-        mcp_log.info(f"Starting Bugzilla MCP server on {cli_args.host}:{cli_args.port}")
+        mcp_log.info(
+            "Starting Bugzilla MCP server on %s:%s", cli_args.host, cli_args.port
+        )
     else:
         mcp_log.info("Starting Bugzilla MCP server on stdio")
 
@@ -39,6 +39,9 @@ def _run_main(monkeypatch, argv, env=None):
         "MCP_AUTH_HEADER",
         "MCP_API_KEY_HEADER",
         "BUGZILLA_AUTH_MODE",
+        "MCP_BZ_MAX_CONN",
+        "MCP_BZ_KEEPALIVE",
+        "LOG_LEVEL",
     ):
         monkeypatch.delenv(var, raising=False)
     for k, v in (env or {}).items():
@@ -242,3 +245,77 @@ def test_invalid_bugzilla_auth_mode_env_exits(monkeypatch, captured_mcp_log):
     assert any("Invalid --bugzilla-auth-mode" in r.message for r in critical_logs), (
         f"Expected critical log for invalid bugzilla-auth-mode, got: {[r.message for r in critical_logs]}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Bugzilla connection pool limits
+# ---------------------------------------------------------------------------
+
+
+def test_pool_limits_default(monkeypatch):
+    from mcp_bugzilla import server
+
+    _run_main(monkeypatch, ["--bugzilla-server", "https://bugzilla.example.com"])
+    assert server.cli_args.bugzilla_max_connections == 100
+    assert server.cli_args.bugzilla_max_keepalive == 20
+
+
+def test_pool_limits_from_env(monkeypatch):
+    from mcp_bugzilla import server
+
+    _run_main(
+        monkeypatch,
+        ["--bugzilla-server", "https://bugzilla.example.com"],
+        env={"MCP_BZ_MAX_CONN": "8", "MCP_BZ_KEEPALIVE": "4"},
+    )
+    assert server.cli_args.bugzilla_max_connections == 8
+    assert server.cli_args.bugzilla_max_keepalive == 4
+
+
+def test_pool_max_connections_must_be_positive(monkeypatch):
+    with pytest.raises(SystemExit):
+        _run_main(
+            monkeypatch,
+            [
+                "--bugzilla-server",
+                "https://bugzilla.example.com",
+                "--bugzilla-max-connections",
+                "0",
+            ],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Log level
+# ---------------------------------------------------------------------------
+
+
+def test_log_level_default(monkeypatch):
+    from mcp_bugzilla import server
+
+    _run_main(monkeypatch, ["--bugzilla-server", "https://bugzilla.example.com"])
+    assert server.cli_args.log_level == "INFO"
+
+
+def test_log_level_flag_overrides_env(monkeypatch):
+    from mcp_bugzilla import server
+
+    _run_main(
+        monkeypatch,
+        ["--bugzilla-server", "https://bugzilla.example.com", "--log-level", "error"],
+        env={"LOG_LEVEL": "debug"},
+    )
+    assert server.cli_args.log_level == "ERROR"
+
+
+def test_log_level_rejects_unknown_level(monkeypatch):
+    with pytest.raises(SystemExit):
+        _run_main(
+            monkeypatch,
+            [
+                "--bugzilla-server",
+                "https://bugzilla.example.com",
+                "--log-level",
+                "loud",
+            ],
+        )
@@ -1,8 +1,26 @@
+import asyncio
+import gc
+import logging
+import queue
+from logging.handlers import QueueHandler
+from unittest.mock import MagicMock
+
+import httpx
+import orjson
 import pytest
 import pytest_asyncio
 import respx
 from httpx import Response
-from mcp_bugzilla.mcp_utils import Bugzilla, is_textual, safe_filename
+from mcp_bugzilla import mcp_utils
+from mcp_bugzilla.mcp_utils import (
+    BatchingQueueListener,
+    Bugzilla,
+    ColorFormatter,
+    is_textual,
+    new_http_client,
+    safe_filename,
+    single_flight,
+)
 from datetime import datetime
 
 MOCK_URL = "https://bugzilla.example.com"
@@ -60,6 +78,79 @@ async def test_bug_info_single(bz_client):
         assert route_bug.called
 
 
+@pytest.mark.asyncio
+async def test_bug_info_coalesces_concurrent_requests(bz_client):
+    """Concurrent identical bug_info calls share one HTTP request per API key."""
+    other_key = Bugzilla(MOCK_URL, "other_key")
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        route_bug = respx_mock.get("/rest/bug/123").mock(
+            return_value=Response(200, json={"bugs": [{"id": 123}]})
+        )
+
+        results = await asyncio.gather(
+            bz_client.bug_info({123}),
+            bz_client.bug_info({123}),
+            other_key.bug_info({123}),
+        )
+        assert [env["bugs"][0]["id"] for env in results] == [123, 123, 123]
+        assert route_bug.call_count == 2
+
+        # Nothing is cached once the shared request has completed.
+        await bz_client.bug_info({123})
+        assert route_bug.call_count == 3
+    await other_key.close()
+
+
+@pytest.mark.asyncio
+async def test_bug_info_coalesced_callers_get_independent_copies(bz_client):
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        respx_mock.get("/rest/bug/123").mock(
+            return_value=Response(200, json={"bugs": [{"id": 123, "summary": "x"}]})
+        )
+        first, second = await asyncio.gather(
+            bz_client.bug_info({123}), bz_client.bug_info({123})
+        )
+    first["bugs"][0]["summary"] = "changed"
+    first["bugs"].append({"id": 456})
+    first["faults"] = []
+    assert second == {"bugs": [{"id": 123, "summary": "x"}]}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_retrieves_error_when_all_callers_cancel():
+    """A fetch failing after every waiter was cancelled is not reported as unretrieved."""
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    previous = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        raise httpx.ConnectError("boom")
+
+    try:
+        waiters = [
+            asyncio.ensure_future(single_flight(("cancelled",), fetch))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(waiter.cancelled() for waiter in waiters)
+        # Their CancelledError tracebacks keep the shared fetch alive.
+        del waiter, waiters
+
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        gc.collect()
+        assert unhandled == []
+    finally:
+        loop.set_exception_handler(previous)
+
+
 @pytest.mark.asyncio
 async def test_bug_info_multiple(bz_client):
     """Test fetching info for multiple bug IDs"""
@@ -121,6 +212,17 @@ async def test_bug_history(bz_client):
         )
 
 
+@pytest.mark.asyncio
+async def test_bug_history_accepts_alias(bz_client):
+    """Bug aliases are passed through to the endpoint path unchanged."""
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        route = respx_mock.get("/rest/bug/CVE-2026-0001/history").mock(
+            return_value=Response(200, json={"bugs": [{"id": 123, "history": []}]})
+        )
+        assert await bz_client.bug_history("CVE-2026-0001") == []
+        assert route.called
+
+
 @pytest.mark.asyncio
 async def test_bug_comments(bz_client):
     async with respx.mock(base_url=MOCK_URL) as respx_mock:
@@ -154,6 +256,80 @@ async def test_bug_comments(bz_client):
         )
 
 
+@pytest.mark.asyncio
+async def test_bug_comments_without_private(bz_client):
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        respx_mock.get("/rest/bug/123/comment").mock(
+            return_value=Response(
+                200,
+                json={
+                    "bugs": {
+                        "123": {
+                            "comments": [
+                                {"id": 1, "text": "public", "is_private": False},
+                                {"id": 2, "text": "secret", "is_private": True},
+                                {"id": 3, "text": "no flag"},
+                            ]
+                        }
+                    }
+                },
+            )
+        )
+
+        everything = await bz_client.bug_comments(123)
+        assert [c["id"] for c in everything] == [1, 2, 3]
+
+        public = await bz_client.bug_comments(123, include_private=False)
+        assert [c["id"] for c in public] == [1, 3]
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, size: int):
+        self.chunks = [body[i : i + size] for i in range(0, len(body), size)]
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_bug_comments_parses_chunked_body(bz_client):
+    """Comments split across many network chunks are reassembled."""
+    body = orjson.dumps(
+        {
+            "bugs": {
+                "123": {
+                    "comments": [
+                        {"id": i, "text": "x" * 50, "is_private": i % 2 == 0}
+                        for i in range(1, 21)
+                    ]
+                }
+            },
+            "comments": {},
+        }
+    )
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        respx_mock.get("/rest/bug/123/comment").mock(
+            return_value=Response(200, stream=_ChunkedStream(body, 7))
+        )
+
+        public = await bz_client.bug_comments(123, include_private=False)
+        assert [c["id"] for c in public] == list(range(1, 21, 2))
+
+
+@pytest.mark.asyncio
+async def test_bug_comments_http_error(bz_client):
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        respx_mock.get("/rest/bug/999/comment").mock(
+            return_value=Response(
+                404, json={"error": True, "code": 101, "message": "no such bug"}
+            )
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await bz_client.bug_comments(999)
+
+
 @pytest.mark.asyncio
 async def test_add_comment(bz_client):
     async with respx.mock(base_url=MOCK_URL) as respx_mock:
@@ -341,6 +517,21 @@ async def test_quicksearch(bz_client):
         assert params["include_fields"] == "id,product"
 
 
+@pytest.mark.asyncio
+async def test_quicksearch_defaults(bz_client):
+    async with respx.mock(base_url=MOCK_URL) as respx_mock:
+        route = respx_mock.get("/rest/bug").mock(
+            return_value=Response(200, json={"bugs": []})
+        )
+
+        await bz_client.quicksearch("status:NEW")
+
+        params = route.calls.last.request.url.params
+        assert params["limit"] == "50"
+        assert params["offset"] == "0"
+        assert "include_fields" not in params
+
+
 @pytest.mark.asyncio
 async def test_update_bug_single_field(bz_client):
     """Test updating a single field"""
@@ -729,3 +920,140 @@ async def test_bearer_client_sends_auth_header_not_param():
             assert "authorization" in dict(route.calls.last.request.headers)
     finally:
         await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_accepts_compressed_responses():
+    client = new_http_client(MOCK_URL)
+    assert {"gzip", "br"} <= set(client.headers["accept-encoding"].split(", "))
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_applies_per_instance_keys():
+    """Wrappers sharing one client each send their own key and leave it open."""
+    shared = new_http_client(MOCK_URL)
+    try:
+        alice = Bugzilla(MOCK_URL, api_key="alice", client=shared)
+        anon = Bugzilla(MOCK_URL, api_key="", client=shared)
+        async with respx.mock(base_url=MOCK_URL) as respx_mock:
+            route = respx_mock.get("/rest/bug/1").mock(
+                return_value=Response(200, json={"bugs": [{"id": 1}]})
+            )
+            await alice.bug_info({1})
+            assert route.calls.last.request.url.params["api_key"] == "alice"
+            await anon.bug_info({1})
+            assert "api_key" not in route.calls.last.request.url.params
+
+        await alice.close()
+        assert not shared.is_closed
+    finally:
+        await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_does_not_replay_cookies():
+    """A cookie set on one user's response is not sent with another's request."""
+    shared = new_http_client(MOCK_URL)
+    try:
+        alice = Bugzilla(MOCK_URL, api_key="alice", client=shared)
+        bob = Bugzilla(MOCK_URL, api_key="bob", client=shared)
+        async with respx.mock(base_url=MOCK_URL) as respx_mock:
+            route = respx_mock.get("/rest/bug/1").mock(
+                return_value=Response(
+                    200,
+                    json={"bugs": [{"id": 1}]},
+                    headers={"Set-Cookie": "Bugzilla_logincookie=alice; Path=/"},
+                )
+            )
+            await alice.bug_info({1})
+            await bob.bug_info({1})
+            assert route.call_count == 2
+            assert "cookie" not in route.calls.last.request.headers
+        assert not shared.cookies
+    finally:
+        await shared.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Log batching
+# ---------------------------------------------------------------------------
+
+
+class _CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _record(level, msg):
+    return logging.LogRecord("bugzilla-mcp", level, __file__, 0, msg, None, None)
+
+
+@pytest.mark.parametrize(
+    "level,msg,color",
+    [
+        (logging.INFO, "[LLM-REQ] bug_info(ids={1})", ColorFormatter.CYAN),
+        (logging.INFO, "[LLM-RES]: oops", ColorFormatter.CYAN),
+        (logging.INFO, "[BZ-REQ] GET /rest/bug/1", ColorFormatter.GREEN),
+        (logging.DEBUG, "[BZ-RES] {}", ColorFormatter.GREEN),
+        (logging.ERROR, "[BZ-RES] Failed: 500", ColorFormatter.RED),
+        (logging.INFO, "Starting Bugzilla MCP server", None),
+        (logging.INFO, "[other] not a known tag", None),
+    ],
+)
+def test_color_formatter(level, msg, color):
+    out = ColorFormatter().format(_record(level, msg))
+    if color is None:
+        assert out == f"[{logging.getLevelName(level)}]: {msg}"
+    else:
+        assert out.startswith(color) and out.endswith(ColorFormatter.RESET)
+        assert msg in out
+
+
+def test_batching_listener_flushes_on_drain_and_errors():
+    q = queue.SimpleQueue()
+    h = _CountingHandler()
+    listener = BatchingQueueListener(q, h)
+
+    q.put(_record(logging.INFO, "pending"))
+    listener.handle(_record(logging.INFO, "[LLM-REQ] first"))
+    assert h.flushes == 0  # more records are queued behind this one
+
+    listener.handle(_record(logging.ERROR, "[BZ-RES] Failed"))
+    assert h.flushes == 1  # errors are written out immediately
+
+    listener.handle(q.get())
+    assert h.flushes == 2  # queue drained
+    assert [r.msg for r in h.records] == [
+        "[LLM-REQ] first",
+        "[BZ-RES] Failed",
+        "pending",
+    ]
+
+
+def test_log_listener_starts_only_when_asked(monkeypatch):
+    """Importing the module logs synchronously; start_log_listener() hands over once."""
+    listener = MagicMock()
+    register = MagicMock()
+    monkeypatch.setattr(mcp_utils, "log_listener", listener)
+    monkeypatch.setattr(mcp_utils.atexit, "register", register)
+    handlers = list(mcp_utils.mcp_log.handlers)
+    if mcp_utils._direct_handler not in handlers:
+        pytest.skip("listener already started by an earlier test")
+    try:
+        mcp_utils.start_log_listener()
+        mcp_utils.start_log_listener()
+        listener.start.assert_called_once_with()
+        register.assert_called_once_with(listener.stop)
+        assert mcp_utils._direct_handler not in mcp_utils.mcp_log.handlers
+        assert any(isinstance(h, QueueHandler) for h in mcp_utils.mcp_log.handlers)
+    finally:
+        mcp_utils.mcp_log.handlers[:] = handlers
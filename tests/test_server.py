@@ -1,7 +1,11 @@
+import asyncio
 import base64
 import os
-from unittest.mock import AsyncMock
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 from fastmcp.exceptions import ToolError
 
@@ -310,3 +314,203 @@ async def test_list_attachments_tool_passthrough():
 
     assert [a["id"] for a in result] == [1, 2]
     bz.list_attachments.assert_awaited_once_with(123)
+
+
+@pytest.mark.asyncio
+async def test_tool_failures_are_wrapped_in_tool_error():
+    bz = AsyncMock()
+    bz.bug_history = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(ToolError, match="Failed to fetch bug history\nReason: boom"):
+        await server.bug_history(id=1, bz=bz)
+
+
+@pytest.mark.asyncio
+async def test_tool_validation_errors_propagate_unchanged():
+    with pytest.raises(ToolError, match="^No bug IDs provided$"):
+        await server.bug_info(bug_ids=set(), bz=AsyncMock())
+
+
+def _patch_get_bz(monkeypatch, bz):
+    """Make server.get_bz() yield ``bz``; returns the list of times it was entered."""
+    entered = []
+
+    @asynccontextmanager
+    async def get_bz():
+        entered.append(bz)
+        yield bz
+
+    monkeypatch.setattr(server, "get_bz", get_bz)
+    return entered
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_info_adds_bugzilla_version_to_snapshot(monkeypatch):
+    monkeypatch.setattr(
+        server,
+        "server_info",
+        MappingProxyType({"transport": "http", "mcp_version": "1"}),
+    )
+    monkeypatch.setattr(server, "server_info_cache", None)
+    bz = AsyncMock()
+    bz.server_version = AsyncMock(return_value="5.0.4")
+    entered = _patch_get_bz(monkeypatch, bz)
+
+    info = await server.mcp_server_info_resource()
+
+    assert info == {
+        "transport": "http",
+        "mcp_version": "1",
+        "bugzilla_server_version": "5.0.4",
+    }
+    assert "bugzilla_server_version" not in server.server_info
+
+    # Cached: later calls neither reach Bugzilla nor build a client, and each
+    # caller gets its own copy.
+    info["transport"] = "changed"
+    again = await server.mcp_server_info_resource()
+    assert again["transport"] == "http"
+    assert again is not info
+    bz.server_version.assert_awaited_once()
+    assert len(entered) == 1
+
+    # Once the TTL has passed the version is fetched again.
+    fetched_at, cached = server.server_info_cache
+    server.server_info_cache = (fetched_at - server.SERVER_INFO_TTL, cached)
+    await server.mcp_server_info_resource()
+    assert bz.server_version.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_info_failure_is_not_cached(monkeypatch):
+    monkeypatch.setattr(server, "server_info", MappingProxyType({"mcp_version": "1"}))
+    monkeypatch.setattr(server, "server_info_cache", None)
+    bz = AsyncMock()
+    bz.server_version = AsyncMock(side_effect=httpx.ConnectError("down"))
+    _patch_get_bz(monkeypatch, bz)
+
+    assert await server.mcp_server_info_resource() == {"mcp_version": "1"}
+    assert server.server_info_cache is None
+
+
+@pytest.mark.asyncio
+async def test_bug_comments_many_reports_failures_per_bug():
+    async def fake_comments(bug_id, new_since=None, include_private=True):
+        if bug_id == 2:
+            raise RuntimeError("bug 2 is restricted")
+        return [{"id": bug_id * 10, "text": "hi"}]
+
+    bz = AsyncMock()
+    bz.bug_comments = AsyncMock(side_effect=fake_comments)
+
+    result = await server.bug_comments_many(ids={1, 2, 3}, bz=bz)
+
+    assert result == {
+        "comments": {
+            "1": [{"id": 10, "text": "hi"}],
+            "3": [{"id": 30, "text": "hi"}],
+        },
+        "errors": {"2": "bug 2 is restricted"},
+    }
+    bz.bug_comments.assert_any_await(1, new_since=None, include_private=False)
+
+
+@pytest.mark.asyncio
+async def test_quicksearch_syntax_is_cached_until_ttl(monkeypatch):
+    monkeypatch.setattr(server, "quicksearch_syntax_cache", None)
+    monkeypatch.setattr(
+        server,
+        "quicksearch_syntax_url",
+        "https://bugzilla.example.com/page.cgi?id=quicksearch.html",
+    )
+    bz = AsyncMock()
+    bz.client.get = AsyncMock(return_value=MagicMock(status_code=200, text="<html/>"))
+
+    assert await server.quicksearch_syntax_resource(bz=bz) == "<html/>"
+    assert await server.quicksearch_syntax_resource(bz=bz) == "<html/>"
+    assert bz.client.get.await_count == 1
+
+    fetched_at, html = server.quicksearch_syntax_cache
+    server.quicksearch_syntax_cache = (fetched_at - server.QUICKSEARCH_SYNTAX_TTL, html)
+    await server.quicksearch_syntax_resource(bz=bz)
+    assert bz.client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_quicksearch_syntax_coalesces_across_api_keys(monkeypatch):
+    """Like the cache, concurrent fetches are keyed by URL alone."""
+    monkeypatch.setattr(server, "quicksearch_syntax_cache", None)
+    monkeypatch.setattr(
+        server,
+        "quicksearch_syntax_url",
+        "https://bugzilla.example.com/page.cgi?id=quicksearch.html",
+    )
+    release = asyncio.Event()
+
+    async def get(*args, **kwargs):
+        await release.wait()
+        return MagicMock(status_code=200, text="<html/>")
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=get)
+    alice = MagicMock(api_key="alice", client=client)
+    bob = MagicMock(api_key="bob", client=client)
+
+    calls = asyncio.gather(
+        server.quicksearch_syntax_resource(bz=alice),
+        server.quicksearch_syntax_resource(bz=bob),
+    )
+    await asyncio.sleep(0)
+    release.set()
+    assert await calls == ["<html/>", "<html/>"]
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_bug_prompt_lists_one_comment_per_line():
+    bz = AsyncMock()
+    bz.bug_comments = AsyncMock(
+        return_value=[
+            {
+                "id": 1,
+                "creator": "alice",
+                "time": "2026-01-01T10:00:00Z",
+                "text": "Crash",
+            },
+            {
+                "id": 2,
+                "creator": "bob",
+                "time": "2026-01-02T11:00:00Z",
+                "text": "Fixed",
+            },
+        ]
+    )
+
+    prompt = await server.summarize_bug_prompt(id=5, bz=bz)
+
+    assert prompt.endswith(
+        "Comments Data:\n"
+        "- alice @ 2026-01-01T10:00:00Z: Crash\n"
+        "- bob @ 2026-01-02T11:00:00Z: Fixed"
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_bug_prompt_tolerates_missing_fields_and_newlines():
+    bz = AsyncMock()
+    bz.bug_comments = AsyncMock(
+        return_value=[
+            {"id": 1, "text": "Steps:\r\n1. open\n2. crash"},
+            {"id": 2, "creator": "bob", "time": "2026-01-02T11:00:00Z"},
+        ]
+    )
+
+    prompt = await server.summarize_bug_prompt(id=5, bz=bz)
+
+    assert prompt.endswith(
+        "Comments Data:\n"
+        "- unknown @ unknown time: Steps:\n"
+        "  1. open\n"
+        "  2. crash\n"
+        "- bob @ 2026-01-02T11:00:00Z: "
+    )
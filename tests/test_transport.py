@@ -1,11 +1,17 @@
 """Tests for transport selection and per-transport API key sourcing."""
 
+import logging
 from argparse import Namespace
+from contextlib import asynccontextmanager
 from unittest.mock import patch
 
+import httpx
 import pytest
+import respx
+from starlette.requests import Request
 
 from mcp_bugzilla import server
+from mcp_bugzilla.mcp_utils import new_http_client
 
 
 def _base_args(**overrides):
@@ -29,6 +35,28 @@ def _base_args(**overrides):
     return Namespace(**defaults)
 
 
+def _configure(**overrides):
+    """Set the module globals get_bz() reads, as server.start() would."""
+    server.cli_args = _base_args(**overrides)
+    server.base_url = server.cli_args.bugzilla_server
+    server.api_url = f"{server.base_url}/rest"
+    server.mcp_auth_header = (server.cli_args.mcp_auth_header or "").lower().encode()
+
+
+@asynccontextmanager
+async def _get_bz(headers):
+    """Enter get_bz() as if serving an HTTP request that carries ``headers``."""
+    request = Request(
+        {
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+    with patch.object(server, "get_http_request", return_value=request):
+        async with server.get_bz() as bz:
+            yield bz
+
+
 def test_stdio_transport_invokes_mcp_run_stdio():
     server.cli_args = _base_args(transport="stdio", bugzilla_api_key="k")
     with patch.object(server.mcp, "run") as mock_run:
@@ -45,86 +73,149 @@ def test_http_transport_unchanged():
     )
 
 
+def test_start_normalizes_server_urls():
+    server.cli_args = _base_args(bugzilla_server="https://bugzilla.example.com/")
+    with patch.object(server.mcp, "run"):
+        server.start()
+    assert server.base_url == "https://bugzilla.example.com"
+    assert server.api_url == "https://bugzilla.example.com/rest"
+    assert server.bug_url(42) == "https://bugzilla.example.com/show_bug.cgi?id=42"
+    assert (
+        server.quicksearch_syntax_url
+        == "https://bugzilla.example.com/page.cgi?id=quicksearch.html"
+    )
+    assert server.mcp_auth_header == b"apikey"
+
+
+def test_start_starts_log_listener():
+    server.cli_args = _base_args()
+    with (
+        patch.object(server.mcp, "run"),
+        patch.object(server, "start_log_listener") as mock_listener,
+    ):
+        server.start()
+    mock_listener.assert_called_once_with()
+
+
+def test_start_applies_log_level():
+    previous = server.mcp_log.level
+    server.cli_args = _base_args(log_level="WARNING")
+    try:
+        with patch.object(server.mcp, "run"):
+            server.start()
+        assert not server.mcp_log.isEnabledFor(logging.INFO)
+    finally:
+        server.mcp_log.setLevel(previous)
+
+
 @pytest.mark.asyncio
 async def test_get_bz_uses_cli_api_key_in_stdio_mode():
-    server.cli_args = _base_args(transport="stdio", bugzilla_api_key="from-cli")
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="stdio", bugzilla_api_key="from-cli")
 
-    async with server.get_bz(headers={}) as bz:
+    async with _get_bz({}) as bz:
         assert bz.api_key == "from-cli"
 
 
 @pytest.mark.asyncio
 async def test_get_bz_uses_header_in_http_mode():
-    server.cli_args = _base_args(transport="http")
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="http")
+
+    async with _get_bz({"apikey": "from-header"}) as bz:
+        assert bz.api_key == "from-header"
+
+
+@pytest.mark.asyncio
+async def test_get_bz_strips_bearer_scheme_from_authorization_header():
+    """--mcp-auth-header Authorization forwards the token, not "Bearer <token>"."""
+    _configure(transport="http", mcp_auth_header="Authorization")
 
-    async with server.get_bz(headers={"apikey": "from-header"}) as bz:
+    async with _get_bz({"Authorization": "Bearer from-header"}) as bz:
         assert bz.api_key == "from-header"
 
 
 @pytest.mark.asyncio
 async def test_get_bz_ignores_header_when_mcp_auth_header_is_none():
     """When mcp_auth_header is None (i.e. disabled), any client headers should be ignored."""
-    server.cli_args = _base_args(transport="http", mcp_auth_header=None)
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="http", mcp_auth_header=None)
 
-    async with server.get_bz(headers={"apikey": "should-be-ignored"}) as bz:
+    async with _get_bz({"apikey": "should-be-ignored"}) as bz:
         assert bz.api_key == ""
 
 
 @pytest.mark.asyncio
 async def test_get_bz_ignores_header_and_falls_back_to_static_key_when_mcp_auth_header_is_none():
     """When mcp_auth_header is None (i.e. disabled), any client headers should be ignored, and we fall back to static key."""
-    server.cli_args = _base_args(
-        transport="http", mcp_auth_header=None, bugzilla_api_key="static-key"
-    )
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="http", mcp_auth_header=None, bugzilla_api_key="static-key")
 
-    async with server.get_bz(headers={"apikey": "should-be-ignored"}) as bz:
+    async with _get_bz({"apikey": "should-be-ignored"}) as bz:
         assert bz.api_key == "static-key"
 
 
 @pytest.mark.asyncio
 async def test_get_bz_falls_back_to_static_key_in_http_mode():
     """When the per-request header is absent, fall back to --bugzilla-api-key."""
-    server.cli_args = _base_args(transport="http", bugzilla_api_key="static-key")
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="http", bugzilla_api_key="static-key")
 
-    async with server.get_bz(headers={}) as bz:
+    async with _get_bz({}) as bz:
         assert bz.api_key == "static-key"
 
 
 @pytest.mark.asyncio
 async def test_get_bz_anonymous_http_mode():
     """No header and no static key → anonymous (empty api_key)."""
-    server.cli_args = _base_args(transport="http")
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="http")
 
-    async with server.get_bz(headers={}) as bz:
+    async with _get_bz({}) as bz:
         assert bz.api_key == ""
 
 
 @pytest.mark.asyncio
 async def test_get_bz_anonymous_stdio_mode():
     """No --bugzilla-api-key in stdio → anonymous (empty api_key)."""
-    server.cli_args = _base_args(transport="stdio", bugzilla_api_key=None)
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="stdio", bugzilla_api_key=None)
 
-    async with server.get_bz(headers={}) as bz:
+    async with _get_bz({}) as bz:
         assert bz.api_key == ""
 
 
 @pytest.mark.asyncio
 async def test_get_bz_bearer_auth_mode():
     """--bugzilla-auth-mode bearer is passed through to the Bugzilla client."""
-    server.cli_args = _base_args(
-        transport="stdio", bugzilla_api_key="k", bugzilla_auth_mode="bearer"
-    )
-    server.base_url = "https://bugzilla.example.com"
+    _configure(transport="stdio", bugzilla_api_key="k", bugzilla_auth_mode="bearer")
 
-    async with server.get_bz(headers={}) as bz:
+    async with _get_bz({}) as bz:
         assert bz.api_key == "k"
-        # bearer mode: Authorization header set, no api_key query param
-        assert "Authorization" in bz.client.headers
-        assert "api_key" not in bz.client.params
+        # bearer mode: credentials go in the Authorization header, not api_key
+        assert bz.auth.use_auth_header is True
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shares_one_client_between_requests():
+    """get_bz() borrows the lifespan-managed client and leaves it open."""
+    _configure(transport="http")
+
+    with respx.mock(base_url="https://bugzilla.example.com", assert_all_called=False):
+        async with server.lifespan(server.mcp):
+            shared = server.http_client
+            assert str(shared.base_url) == "https://bugzilla.example.com/rest/"
+
+            async with _get_bz({"apikey": "one"}) as bz1:
+                assert bz1.client is shared
+            async with _get_bz({"apikey": "two"}) as bz2:
+                assert bz2.client is shared
+            assert not shared.is_closed
+
+    assert shared.is_closed
+    assert server.http_client is None
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_ignores_failures():
+    client = new_http_client("https://bugzilla.example.com")
+    async with respx.mock(base_url="https://bugzilla.example.com") as respx_mock:
+        route = respx_mock.head("/rest/version").mock(
+            side_effect=httpx.ConnectError("unreachable")
+        )
+        await server.warm_connection(client)
+        assert route.called
+    await client.aclose()